@@ -1,19 +1,47 @@
 import base64
+import gzip
+import io
 import json
 import logging
 import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from decimal import Decimal, InvalidOperation
-from html import escape
 from uuid import uuid4
 
 import boto3
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import BotoCoreError, ClientError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TABLE_NAME = os.getenv("TABLE_NAME", "FnsPokerPlayers")
+POINTS_INDEX_NAME = "ByPoints"
+POINTS_INDEX_PK = "L"
+NAME_INDEX_NAME = "ByName"
+QUERY_PAGE_LIMIT = 500
+MAX_CONCURRENT_WRITES = 10
+HTML_CACHE_TTL_SECONDS = 10
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_html_cache = {"body": None, "gzip_b64": None, "expires": 0.0}
+
+_DYNAMODB = boto3.resource("dynamodb")
+_TABLE = _DYNAMODB.Table(TABLE_NAME)
+
+
+def _get_table(table_name):
+    if table_name == TABLE_NAME:
+        return _TABLE
+    return _DYNAMODB.Table(table_name)
+
 
 def _ordinal(value):
     if 10 <= value % 100 <= 20:
@@ -23,18 +51,31 @@ def _ordinal(value):
     return f"{value}{suffix}"
 
 
+_ORDINALS = tuple(_ordinal(value) for value in range(1024))
+
+
 def _parse_points(value):
     try:
-        return Decimal(str(value))
+        return int(Decimal(str(value)))
     except (InvalidOperation, TypeError, ValueError):
-        return Decimal("0")
+        return 0
+
+
+def _parse_points_int(value):
+    try:
+        parsed = Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    if parsed != parsed.to_integral_value():
+        return None
+    return int(parsed)
 
 
-def _format_points(value):
-    if value == value.to_integral_value():
-        return str(int(value))
-    normalized = format(value.normalize(), "f")
-    return normalized.rstrip("0").rstrip(".")
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+def _escape_html(value):
+    return value.translate(_ESCAPE_TABLE)
 
 
 def _parse_iso_datetime(value):
@@ -46,35 +87,81 @@ def _parse_iso_datetime(value):
         return None
 
 
-def _scan_table_items(table):
+def _is_sortable_updated(value):
+    # Stored timestamps are ISO 8601 UTC, which order lexicographically; the
+    # year-prefix check keeps stray non-date strings out of string max().
+    return bool(value) and value[:4].isdigit()
+
+
+def _points_sort_key(points, name_cf):
+    return f"{10_000_000 - int(points):08d}#{name_cf}"
+
+
+def _query_leaderboard_items(table):
     items = []
-    response = table.scan()
+    query_kwargs = {
+        "IndexName": POINTS_INDEX_NAME,
+        "KeyConditionExpression": Key("gsi_pk").eq(POINTS_INDEX_PK),
+        "ScanIndexForward": True,
+        "Limit": QUERY_PAGE_LIMIT,
+    }
+    response = table.query(**query_kwargs)
     items.extend(response.get("Items", []))
     while "LastEvaluatedKey" in response:
-        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
+        response = table.query(ExclusiveStartKey=response["LastEvaluatedKey"], **query_kwargs)
         items.extend(response.get("Items", []))
-    logger.info("Scanned DynamoDB table '%s' and loaded %d item(s).", table.name, len(items))
+    logger.info("Queried DynamoDB index '%s' and loaded %d item(s).", POINTS_INDEX_NAME, len(items))
     return items
 
 
+def _player_from_item(item):
+    return {
+        "id": str(item.get("id", "")),
+        "name": str(item.get("name", "")),
+        "name_cf": str(item.get("name_cf", "")) or str(item.get("name", "")).casefold(),
+        "points": _parse_points(item.get("points", 0)),
+        "results": str(item.get("results", "")),
+        "updated": str(item.get("updated", "")),
+        "series": str(item.get("series", "")).strip(),
+    }
+
+
 def _load_players(table_name):
-    table = boto3.resource("dynamodb").Table(table_name)
-    items = _scan_table_items(table)
+    """Load leaderboard rows as parallel column lists keyed by field name."""
+    table = _get_table(table_name)
+    items = _query_leaderboard_items(table)
+
+    names = []
+    points = []
+    results = []
+    updated = []
+    series = []
+    for item in items:
+        names.append(str(item.get("name", "")))
+        points.append(_parse_points(item.get("points", 0)))
+        results.append(str(item.get("results", "")))
+        updated.append(str(item.get("updated", "")))
+        series.append(str(item.get("series", "")).strip())
+
+    return {"names": names, "points": points, "results": results, "updated": updated, "series": series}
 
+
+def _load_players_by_names(table, names_cf):
     players = []
-    for item in items:
-        players.append(
-            {
-                "id": str(item.get("id", "")),
-                "name": str(item.get("name", "")),
-                "points": _parse_points(item.get("points", 0)),
-                "results": str(item.get("results", "")),
-                "updated": str(item.get("updated", "")),
-                "series": str(item.get("series", "")).strip(),
-            }
+    for name_cf in names_cf:
+        response = table.query(
+            IndexName=NAME_INDEX_NAME,
+            KeyConditionExpression=Key("name_cf").eq(name_cf),
         )
-
-    players.sort(key=lambda player: (-player["points"], player["name"].lower(), player["name"]))
+        players.extend(_player_from_item(item) for item in response.get("Items", []))
+        while "LastEvaluatedKey" in response:
+            response = table.query(
+                IndexName=NAME_INDEX_NAME,
+                KeyConditionExpression=Key("name_cf").eq(name_cf),
+                ExclusiveStartKey=response["LastEvaluatedKey"],
+            )
+            players.extend(_player_from_item(item) for item in response.get("Items", []))
+    logger.info("Queried DynamoDB index '%s' for %d name(s) and loaded %d player(s).", NAME_INDEX_NAME, len(names_cf), len(players))
     return players
 
 
@@ -91,73 +178,135 @@ def _normalize_results_text(current_results, new_place):
     return f"{current},{new_place}"
 
 
-def _upsert_results(table_name, submitted_results):
+def _dispatch_writes(pending_writes):
+    if not pending_writes:
+        return
+    logger.info("Dispatching %d DynamoDB write(s) concurrently.", len(pending_writes))
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_WRITES, len(pending_writes))) as executor:
+        futures = [executor.submit(write) for write in pending_writes]
+        for future in futures:
+            future.result()
+
+
+def _batch_put_items(table, items):
+    if not items:
+        return
+    logger.info("Batch-writing %d new player item(s).", len(items))
+    with table.batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+
+
+def _validate_submitted(submitted_results):
+    """Validate every submitted row before any DynamoDB work; returns normalized rows."""
     if not isinstance(submitted_results, list) or not submitted_results:
         raise ValueError("Request body must be a non-empty array of results.")
 
-    logger.info("Starting results upsert for %d row(s) into table '%s'.", len(submitted_results), table_name)
-    table = boto3.resource("dynamodb").Table(table_name)
-    players = _load_players(table_name)
-    player_lookup = {
-        (player["name"].casefold(), str(player.get("series", "")).strip().casefold()): player
-        for player in players
-        if player["name"].strip()
-    }
-    now_iso = _now_iso()
-    processed = 0
+    normalized = []
     request_keys = set()
-
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     for index, new_result in enumerate(submitted_results, start=1):
         place = str(new_result.get("place", "None")).strip() or "None"
         name = str(new_result.get("name", new_result.get("player", ""))).strip()
         series = str(new_result.get("series", "")).strip()
-        points = _parse_points(new_result.get("points", 0))
-        logger.info(
-            "Processing row %d: player='%s', series='%s', place='%s', points='%s'.",
-            index,
-            name,
-            series,
-            place,
-            str(points),
-        )
+        points = _parse_points_int(new_result.get("points", 0))
+        if debug_enabled:
+            logger.debug(
+                "Validating row %d: player='%s', series='%s', place='%s', points='%s'.",
+                index,
+                name,
+                series,
+                place,
+                points,
+            )
 
         if not name:
             raise ValueError("Each result row must include a player name.")
         if not series:
             raise ValueError("Each result row must include a series.")
-        if points <= 0 or points != points.to_integral_value():
+        if points is None or points <= 0:
             raise ValueError("Each result row must include whole-number points greater than 0.")
 
-        lookup_key = (name.casefold(), series.casefold())
+        name_cf = name.casefold()
+        lookup_key = (name_cf, series.casefold())
         if lookup_key in request_keys:
             raise ValueError("A player can only appear once in a single save.")
         request_keys.add(lookup_key)
-        existing_player = player_lookup.get(lookup_key)
+        normalized.append(
+            {
+                "place": place,
+                "name": name,
+                "name_cf": name_cf,
+                "series": series,
+                "points": points,
+                "lookup_key": lookup_key,
+            }
+        )
+
+    return normalized
+
+
+def _upsert_results(table_name, submitted_results):
+    normalized_rows = _validate_submitted(submitted_results)
+
+    logger.info("Starting results upsert for %d row(s) into table '%s'.", len(normalized_rows), table_name)
+    started = time.monotonic()
+    table = _get_table(table_name)
+    submitted_names_cf = {row["name_cf"] for row in normalized_rows}
+    players = _load_players_by_names(table, submitted_names_cf)
+    player_lookup = {
+        (player["name_cf"], player["series"].casefold()): player
+        for player in players
+        if player["name"].strip()
+    }
+    now_iso = _now_iso()
+    processed = 0
+    pending_updates = []
+    pending_puts = []
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    for row in normalized_rows:
+        place = row["place"]
+        name = row["name"]
+        name_cf = row["name_cf"]
+        series = row["series"]
+        points = row["points"]
+        existing_player = player_lookup.get(row["lookup_key"])
 
         if existing_player:
             next_points = existing_player["points"] + points
             next_results = _normalize_results_text(existing_player.get("results", ""), place)
-            logger.info(
-                "Updating existing player id='%s' name='%s' series='%s' -> points='%s', results='%s'.",
-                existing_player["id"],
-                existing_player["name"],
-                existing_player.get("series", ""),
-                str(next_points),
-                next_results,
-            )
-            table.update_item(
-                Key={"id": existing_player["id"]},
-                UpdateExpression="SET #points = :points, #results = :results, #updated = :updated",
-                ExpressionAttributeNames={
-                    "#points": "points",
-                    "#results": "results",
-                    "#updated": "updated",
-                },
-                ExpressionAttributeValues={
-                    ":points": next_points,
-                    ":results": next_results,
-                    ":updated": now_iso,
-                },
+            if debug_enabled:
+                logger.debug(
+                    "Updating existing player id='%s' name='%s' series='%s' -> points='%s', results='%s'.",
+                    existing_player["id"],
+                    existing_player["name"],
+                    existing_player.get("series", ""),
+                    next_points,
+                    next_results,
+                )
+            pending_updates.append(
+                partial(
+                    table.update_item,
+                    Key={"id": existing_player["id"]},
+                    UpdateExpression=(
+                        "SET #points = :points, #results = :results, #updated = :updated, "
+                        "gsi_pk = :gsi_pk, gsi_sk = :gsi_sk, name_cf = :name_cf"
+                    ),
+                    ExpressionAttributeNames={
+                        "#points": "points",
+                        "#results": "results",
+                        "#updated": "updated",
+                    },
+                    ExpressionAttributeValues={
+                        ":points": next_points,
+                        ":results": next_results,
+                        ":updated": now_iso,
+                        ":gsi_pk": POINTS_INDEX_PK,
+                        ":gsi_sk": _points_sort_key(next_points, existing_player["name_cf"]),
+                        ":name_cf": existing_player["name_cf"],
+                    },
+                )
             )
             existing_player["points"] = next_points
             existing_player["results"] = next_results
@@ -172,29 +321,48 @@ def _upsert_results(table_name, submitted_results):
                 "points": points,
                 "results": initial_results,
                 "updated": now_iso,
+                "gsi_pk": POINTS_INDEX_PK,
+                "gsi_sk": _points_sort_key(points, name_cf),
+                "name_cf": name_cf,
             }
-            logger.info(
-                "Creating new player id='%s' name='%s' series='%s' with points='%s' and results='%s'.",
-                new_player["id"],
-                new_player["name"],
-                new_player["series"],
-                str(new_player["points"]),
-                new_player["results"],
-            )
-            table.put_item(Item=new_player)
-            player_lookup[lookup_key] = new_player
+            if debug_enabled:
+                logger.debug(
+                    "Creating new player id='%s' name='%s' series='%s' with points='%s' and results='%s'.",
+                    new_player["id"],
+                    new_player["name"],
+                    new_player["series"],
+                    new_player["points"],
+                    new_player["results"],
+                )
+            pending_puts.append(new_player)
+            player_lookup[row["lookup_key"]] = new_player
 
         processed += 1
 
-    logger.info("Results upsert complete. Processed %d row(s).", processed)
+    _dispatch_writes(pending_updates)
+    _batch_put_items(table, pending_puts)
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    logger.info("Results upsert complete. Processed %d row(s) in %d ms.", processed, elapsed_ms)
     return {"processed": processed}
 
 
+def _json_dumps(payload):
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+def _json_loads(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def _json_response(status_code, payload):
     return {
         "statusCode": status_code,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(payload),
+        "body": _json_dumps(payload),
     }
 
 
@@ -206,6 +374,31 @@ def _html_response(status_code, body):
     }
 
 
+def _gzip_html_body(body):
+    return base64.b64encode(gzip.compress(body.encode("utf-8"), compresslevel=6)).decode("ascii")
+
+
+def _gzip_html_response(status_code, gzip_b64_body):
+    return {
+        "statusCode": status_code,
+        "headers": {
+            "Content-Type": "text/html",
+            "Content-Encoding": "gzip",
+            "Vary": "Accept-Encoding",
+        },
+        "body": gzip_b64_body,
+        "isBase64Encoded": True,
+    }
+
+
+def _accepts_gzip(event):
+    headers = event.get("headers") or {}
+    for key, value in headers.items():
+        if str(key).lower() == "accept-encoding":
+            return "gzip" in str(value).lower()
+    return False
+
+
 def _http_method(event):
     request_context = event.get("requestContext", {})
     http_context = request_context.get("http", {})
@@ -222,174 +415,141 @@ def _parse_json_body(event):
     if event.get("isBase64Encoded"):
         body = base64.b64decode(body).decode("utf-8")
     logger.info("Received request body length: %d", len(body))
-    return json.loads(body)
+    return _json_loads(body)
 
 
 def _rank_label(index, points, point_counts):
-    label = _ordinal(index)
+    label = _ORDINALS[index] if index < len(_ORDINALS) else _ordinal(index)
     if point_counts.get(points, 0) > 1:
         return f"T{label}"
     return label
 
 
-def _latest_updated_text(players):
-    latest = None
-    for player in players:
-        parsed = _parse_iso_datetime(player["updated"])
-        if parsed and (latest is None or parsed > latest):
-            latest = parsed
-
-    if latest is None:
-        return "Unknown"
-
-    return f"{latest.month}/{latest.day}/{latest.year}"
-
-
 def _series_latest_updated_text(players):
     latest_by_series = {}
-    for player in players:
-        series = str(player.get("series", "")).strip()
-        if not series:
+    for series, updated in zip(players["series"], players["updated"]):
+        if not series or not _is_sortable_updated(updated):
             continue
 
-        parsed_updated = _parse_iso_datetime(player.get("updated", ""))
         current_latest = latest_by_series.get(series)
-        if parsed_updated and (current_latest is None or parsed_updated > current_latest):
-            latest_by_series[series] = parsed_updated
+        if current_latest is None or updated > current_latest:
+            latest_by_series[series] = updated
 
     text_by_series = {}
-    for series, latest in latest_by_series.items():
+    for series, latest_str in latest_by_series.items():
+        latest = _parse_iso_datetime(latest_str)
         text_by_series[series] = f"{latest.month}/{latest.day}/{latest.year}" if latest else "Unknown"
     return text_by_series
 
 
 def _series_values_by_latest_updated(players):
     latest_by_series = {}
-    for player in players:
-        series = str(player.get("series", "")).strip()
+    for series, updated in zip(players["series"], players["updated"]):
         if not series:
             continue
 
-        parsed_updated = _parse_iso_datetime(player.get("updated", ""))
+        candidate = updated if _is_sortable_updated(updated) else None
         prior = latest_by_series.get(series)
-        if prior is None or (parsed_updated is not None and parsed_updated > prior):
-            latest_by_series[series] = parsed_updated
+        if series not in latest_by_series or (candidate is not None and (prior is None or candidate > prior)):
+            latest_by_series[series] = candidate
 
-    ordered = sorted(
-        latest_by_series.items(),
-        key=lambda entry: (
-            -(entry[1].timestamp() if entry[1] is not None else float("-inf")),
-            entry[0].lower(),
-            entry[0],
-        ),
-    )
+    ordered = sorted(latest_by_series.items(), key=lambda entry: (entry[0].lower(), entry[0]))
+    ordered.sort(key=lambda entry: (entry[1] is not None, entry[1] or ""), reverse=True)
     return [series for series, _latest in ordered]
 
 
-def _render_rows(players, ordered_series_values):
-    series_to_players = {}
-    for player in players:
-        series = str(player.get("series", "")).strip()
-        series_to_players.setdefault(series, []).append(player)
+def _render_leaderboard(players, ordered_series_values):
+    """Build row HTML, player datalist options, and the latest-updated text in one traversal."""
+    names = players["names"]
+    points = players["points"]
+    results = players["results"]
+    updated = players["updated"]
+    series_values = players["series"]
+
+    series_to_indices = {}
+    for i, series in enumerate(series_values):
+        series_to_indices.setdefault(series, []).append(i)
 
-    rows = []
     ordered_series = list(ordered_series_values)
     ordered_series_set = set(ordered_series_values)
-    unordered_series = [series for series in series_to_players.keys() if series not in ordered_series_set]
+    unordered_series = [series for series in series_to_indices.keys() if series not in ordered_series_set]
     ordered_series.extend(sorted(unordered_series, key=lambda value: (value.lower(), value)))
 
+    rows_buf = io.StringIO()
+    name_set = set()
+    latest_str = None
     for series in ordered_series:
-        series_players = series_to_players.get(series, [])
-        if not series_players:
+        series_indices = series_to_indices.get(series, [])
+        if not series_indices:
             continue
 
-        series_players.sort(key=lambda player: (-player["points"], player["name"].lower(), player["name"]))
-        point_counts = {}
-        for player in series_players:
-            points = player["points"]
-            point_counts[points] = point_counts.get(points, 0) + 1
+        # The ByPoints index returns rows ordered by points desc, then
+        # casefolded name, so grouped indices are already in display order.
+        point_counts = Counter(points[i] for i in series_indices)
 
         display_rank = 0
         previous_points = None
-        for index, player in enumerate(series_players, start=1):
-            if previous_points is None or player["points"] != previous_points:
+        for index, i in enumerate(series_indices, start=1):
+            if previous_points is None or points[i] != previous_points:
                 display_rank = index
 
-            rank = _rank_label(display_rank, player["points"], point_counts)
-            previous_points = player["points"]
-            rows.append(
-                "\n".join(
-                    [
-                        f"                <tr data-series=\"{escape(player.get('series', ''))}\">",
-                        f"                    <td>{escape(rank)}</td>",
-                        f"                    <td>{escape(player['name'])}</td>",
-                        f"                    <td>{escape(_format_points(player['points']))}</td>",
-                        f"                    <td>{escape(player['results'])}</td>",
-                        "                </tr>",
-                    ]
-                )
+            rank = _rank_label(display_rank, points[i], point_counts)
+            previous_points = points[i]
+
+            if _is_sortable_updated(updated[i]) and (latest_str is None or updated[i] > latest_str):
+                latest_str = updated[i]
+
+            stripped_name = names[i].strip()
+            if stripped_name:
+                name_set.add(stripped_name)
+
+            if rows_buf.tell():
+                rows_buf.write("\n")
+            rows_buf.write(
+                f"                <tr data-series=\"{_escape_html(series_values[i])}\">\n"
+                f"                    <td>{_escape_html(rank)}</td>\n"
+                f"                    <td>{_escape_html(names[i])}</td>\n"
+                f"                    <td>{points[i]}</td>\n"
+                f"                    <td>{_escape_html(results[i])}</td>\n"
+                "                </tr>"
             )
 
-    return "\n".join(rows)
-
-
-def _render_player_name_options(players):
-    names = sorted(
-        {player["name"].strip() for player in players if player["name"].strip()},
-        key=lambda value: (value.lower(), value),
-    )
-    return "\n".join([f"        <option value=\"{escape(name)}\"></option>" for name in names])
+    sorted_names = sorted(name_set, key=lambda value: (value.lower(), value))
+    options_html = "\n".join([f"        <option value=\"{_escape_html(name)}\"></option>" for name in sorted_names])
+    latest = _parse_iso_datetime(latest_str)
+    updated_text = "Unknown" if latest is None else f"{latest.month}/{latest.day}/{latest.year}"
+    return rows_buf.getvalue(), options_html, updated_text
 
 
 def _export_rows(players):
+    names = players["names"]
+    points = players["points"]
+    results = players["results"]
+    updated = players["updated"]
+    series = players["series"]
     ordered = sorted(
-        players,
-        key=lambda player: (
-            str(player.get("series", "")).lower(),
-            str(player.get("series", "")),
-            -player["points"],
-            player["name"].lower(),
-            player["name"],
+        range(len(names)),
+        key=lambda i: (
+            series[i].lower(),
+            series[i],
+            -points[i],
+            names[i].lower(),
+            names[i],
         ),
     )
     return [
         {
-            "name": player["name"],
-            "series": str(player.get("series", "")),
-            "points": _format_points(player["points"]),
-            "results": player["results"],
-            "updated": player["updated"],
+            "name": names[i],
+            "series": series[i],
+            "points": str(points[i]),
+            "results": results[i],
+            "updated": updated[i],
         }
-        for player in ordered
+        for i in ordered
     ]
 
 
-def _render_html(players):
-    updated_text = _latest_updated_text(players)
-    series_values = _series_values_by_latest_updated(players)
-    series_values_json = json.dumps(series_values).replace("</", "<\\/")
-    updated_text_by_series_json = json.dumps(_series_latest_updated_text(players)).replace("</", "<\\/")
-    export_rows_json = json.dumps(_export_rows(players)).replace("</", "<\\/")
-    series_options_html = "\n".join(
-        [f"                    <option value=\"{escape(series)}\">{escape(series)}</option>" for series in series_values]
-    )
-    dialog_series_options_html = "\n".join(
-        [f"                        <option value=\"{escape(series)}\">{escape(series)}</option>" for series in series_values]
-    )
-    export_series_checkboxes_html = "\n".join(
-        [
-            (
-                "                    <label class=\"export-series-option\">"
-                f"<input type=\"checkbox\" name=\"export-series\" value=\"{escape(series)}\" checked> {escape(series)}"
-                "</label>"
-            )
-            for series in series_values
-        ]
-    )
-    rows_html = _render_rows(players, series_values)
-    player_name_options_html = _render_player_name_options(players)
-
-    return f"""<!DOCTYPE html>
+_HTML_BEFORE_SERIES_OPTIONS = """<!DOCTYPE html>
 <html>
     <head>
         <meta charset=\"UTF-8\">
@@ -405,10 +565,14 @@ def _render_html(players):
         <div class="series-updated-row">
             <div class="series-filter-wrap">
                 <select id="series-filter" name="series-filter" aria-label="Series">
-{series_options_html}
+"""
+
+_HTML_BEFORE_UPDATED_TEXT = """
                 </select>
             </div>
-            <p class="updated-text">Updated {escape(updated_text)}</p>
+            <p class="updated-text">Updated """
+
+_HTML_BEFORE_ROWS = """</p>
         </div>
         <table>
             <thead>
@@ -420,7 +584,9 @@ def _render_html(players):
                 </tr>
             </thead>
             <tbody id="leaderboard-rows">
-{rows_html}
+"""
+
+_HTML_BEFORE_DIALOG_SERIES_OPTIONS = """
             </tbody>
         </table>
         <div class=\"bottom-actions\">
@@ -435,7 +601,9 @@ def _render_html(players):
                     <h3>Add Results to:</h3>
                     <div class="dialog-series-controls">
                         <select id="dialog-series-select" name="dialog-series-select" aria-label="Series for new results">
-{dialog_series_options_html}
+"""
+
+_HTML_BEFORE_EXPORT_SERIES_CHECKBOXES = """
                         </select>
                         <input
                             type="text"
@@ -482,7 +650,9 @@ def _render_html(players):
                 </fieldset>
                 <fieldset>
                     <legend>Series</legend>
-{export_series_checkboxes_html}
+"""
+
+_HTML_BEFORE_PLAYER_NAME_OPTIONS = """
                 </fieldset>
             </div>
             <footer class="dialog-actions">
@@ -492,7 +662,9 @@ def _render_html(players):
         </article>
     </dialog>
     <datalist id=\"player-name-options\">
-{player_name_options_html}
+"""
+
+_HTML_BEFORE_SERIES_VALUES_JSON = """
     </datalist>
     <script>
         const PASSWORD = "fn$p@$$w0rd"; // todo - key vault
@@ -506,9 +678,15 @@ def _render_html(players):
         const newSeriesButton = document.getElementById("new-series-button");
         const leaderboardRows = document.getElementById("leaderboard-rows");
         const updatedText = document.querySelector(".updated-text");
-        const seriesNames = {series_values_json};
-        const updatedBySeries = {updated_text_by_series_json};
-        const exportRows = {export_rows_json};
+        const seriesNames = """
+
+_HTML_BEFORE_UPDATED_BY_SERIES_JSON = """;
+        const updatedBySeries = """
+
+_HTML_BEFORE_EXPORT_ROWS_JSON = """;
+        const exportRows = """
+
+_HTML_SUFFIX = """;
         const addResultsDialog = document.getElementById("add-results-dialog");
         const exportDialog = document.getElementById("export-dialog");
         const addRowButton = document.getElementById("add-row-button");
@@ -519,92 +697,92 @@ def _render_html(players):
         const resultsRows = document.getElementById("results-rows");
         let isNewSeriesMode = false;
 
-        function setDialogSeriesMode(useNewSeries) {{
+        function setDialogSeriesMode(useNewSeries) {
             isNewSeriesMode = useNewSeries;
-            if (dialogSeriesSelect) {{
+            if (dialogSeriesSelect) {
                 dialogSeriesSelect.hidden = useNewSeries;
-            }}
-            if (newSeriesInput) {{
+            }
+            if (newSeriesInput) {
                 newSeriesInput.hidden = !useNewSeries;
-                if (useNewSeries) {{
+                if (useNewSeries) {
                     newSeriesInput.focus();
-                }} else {{
+                } else {
                     newSeriesInput.value = "";
-                }}
-            }}
-            if (newSeriesButton) {{
+                }
+            }
+            if (newSeriesButton) {
                 newSeriesButton.textContent = useNewSeries ? "Choose" : "New";
-            }}
-        }}
+            }
+        }
 
-        function applySeriesFilter() {{
-            if (!seriesFilter || !leaderboardRows) {{
+        function applySeriesFilter() {
+            if (!seriesFilter || !leaderboardRows) {
                 return;
-            }}
+            }
             const selectedSeries = seriesFilter.value;
             const rows = Array.from(leaderboardRows.querySelectorAll("tr"));
-            for (const row of rows) {{
+            for (const row of rows) {
                 const rowSeries = row.getAttribute("data-series") || "";
                 row.style.display = rowSeries === selectedSeries ? "" : "none";
-            }}
-            if (updatedText) {{
+            }
+            if (updatedText) {
                 const nextUpdatedText = updatedBySeries[selectedSeries] || "Unknown";
-                updatedText.textContent = `Updated ${{nextUpdatedText}}`;
-            }}
-        }}
+                updatedText.textContent = `Updated ${nextUpdatedText}`;
+            }
+        }
 
-        if (seriesFilter) {{
+        if (seriesFilter) {
             const params = new URLSearchParams(window.location.search);
             const requestedSeries = (params.get("series") || "").trim();
-            if (requestedSeries) {{
+            if (requestedSeries) {
                 const match = Array.from(seriesFilter.options).find((option) => option.value.toLowerCase() === requestedSeries.toLowerCase());
-                if (match) {{
+                if (match) {
                     seriesFilter.value = match.value;
-                }}
-            }}
+                }
+            }
             seriesFilter.addEventListener("change", applySeriesFilter);
             applySeriesFilter();
-        }}
+        }
 
-        if (newSeriesButton) {{
-            newSeriesButton.addEventListener("click", () => {{
+        if (newSeriesButton) {
+            newSeriesButton.addEventListener("click", () => {
                 setDialogSeriesMode(!isNewSeriesMode);
-            }});
-        }}
+            });
+        }
 
-        function getSelectedExportSeries() {{
-            if (!exportDialog) {{
+        function getSelectedExportSeries() {
+            if (!exportDialog) {
                 return [];
-            }}
+            }
             const checked = Array.from(exportDialog.querySelectorAll("input[name='export-series']:checked"));
             return checked.map((input) => input.value);
-        }}
+        }
 
-        function getSelectedExportFormat() {{
-            if (!exportDialog) {{
+        function getSelectedExportFormat() {
+            if (!exportDialog) {
                 return "csv";
-            }}
+            }
             const selected = exportDialog.querySelector("input[name='export-format']:checked");
             return selected ? selected.value : "csv";
-        }}
+        }
 
-        function toCsvValue(value) {{
+        function toCsvValue(value) {
             const text = String(value ?? "");
-            const sanitized = /^[=+\\-@\\t\\r]/.test(text) ? `'${{text}}` : text;
-            return `"${{sanitized.replace(/"/g, '""')}}"`;
-        }}
+            const sanitized = /^[=+\\-@\\t\\r]/.test(text) ? `'${text}` : text;
+            return `"${sanitized.replace(/"/g, '""')}"`;
+        }
 
-        function buildCsv(rows) {{
+        function buildCsv(rows) {
             const headers = ["series", "name", "points", "results", "updated"];
             const lines = [headers.join(",")];
-            for (const row of rows) {{
+            for (const row of rows) {
                 lines.push(headers.map((key) => toCsvValue(row[key])).join(","));
-            }}
+            }
             return lines.join("\\n");
-        }}
+        }
 
-        function downloadExportFile(fileName, content, mimeType) {{
-            const blob = new Blob([content], {{ type: mimeType }});
+        function downloadExportFile(fileName, content, mimeType) {
+            const blob = new Blob([content], { type: mimeType });
             const url = window.URL.createObjectURL(blob);
             const anchor = document.createElement("a");
             anchor.href = url;
@@ -613,65 +791,65 @@ def _render_html(players):
             anchor.click();
             anchor.remove();
             window.URL.revokeObjectURL(url);
-        }}
+        }
 
-        if (exportLink && exportDialog) {{
-            exportLink.addEventListener("click", (event) => {{
+        if (exportLink && exportDialog) {
+            exportLink.addEventListener("click", (event) => {
                 event.preventDefault();
                 exportDialog.showModal();
-            }});
-        }}
+            });
+        }
 
-        if (cancelExportButton && exportDialog) {{
-            cancelExportButton.addEventListener("click", () => {{
+        if (cancelExportButton && exportDialog) {
+            cancelExportButton.addEventListener("click", () => {
                 exportDialog.close();
-            }});
-        }}
+            });
+        }
 
-        if (confirmExportButton && exportDialog) {{
-            confirmExportButton.addEventListener("click", () => {{
+        if (confirmExportButton && exportDialog) {
+            confirmExportButton.addEventListener("click", () => {
                 const selectedSeries = new Set(getSelectedExportSeries());
-                if (selectedSeries.size === 0) {{
+                if (selectedSeries.size === 0) {
                     window.alert("Select at least one series to export.");
                     return;
-                }}
+                }
 
                 const filteredRows = exportRows.filter((row) => selectedSeries.has(row.series));
                 const format = getSelectedExportFormat();
                 const timestamp = new Date().toISOString().replace(/[:.]/g, "-");
-                if (format === "json") {{
-                    downloadExportFile(`poker-results-${{timestamp}}.json`, JSON.stringify(filteredRows, null, 2), "application/json");
-                }} else {{
-                    downloadExportFile(`poker-results-${{timestamp}}.csv`, buildCsv(filteredRows), "text/csv;charset=utf-8");
-                }}
+                if (format === "json") {
+                    downloadExportFile(`poker-results-${timestamp}.json`, JSON.stringify(filteredRows, null, 2), "application/json");
+                } else {
+                    downloadExportFile(`poker-results-${timestamp}.csv`, buildCsv(filteredRows), "text/csv;charset=utf-8");
+                }
                 exportDialog.close();
-            }});
-        }}
+            });
+        }
 
-        function getNextPlace(currentPlace) {{
+        function getNextPlace(currentPlace) {
             const currentIndex = placeOptions.indexOf(currentPlace);
-            if (currentIndex < 0 || currentIndex === placeOptions.length - 1) {{
+            if (currentIndex < 0 || currentIndex === placeOptions.length - 1) {
                 return placeOptions[placeOptions.length - 1];
-            }}
+            }
             return placeOptions[currentIndex + 1];
-        }}
+        }
 
-        function createPlaceSelect(defaultPlace) {{
+        function createPlaceSelect(defaultPlace) {
             const select = document.createElement("select");
             select.className = "place-select";
-            for (const place of placeOptions) {{
+            for (const place of placeOptions) {
                 const option = document.createElement("option");
                 option.value = place;
                 option.textContent = place;
-                if (place === defaultPlace) {{
+                if (place === defaultPlace) {
                     option.selected = true;
-                }}
+                }
                 select.appendChild(option);
-            }}
+            }
             return select;
-        }}
+        }
 
-        function createResultRow(defaultPlace) {{
+        function createResultRow(defaultPlace) {
             const row = document.createElement("tr");
 
             const placeCell = document.createElement("td");
@@ -694,7 +872,7 @@ def _render_html(players):
             pointsInput.setAttribute("pattern", "[0-9]*");
             pointsInput.placeholder = "Points";
             pointsInput.required = true;
-            pointsInput.addEventListener("keydown", (event) => {{
+            pointsInput.addEventListener("keydown", (event) => {
                 const allowedKeys = new Set([
                     "Backspace",
                     "Delete",
@@ -704,28 +882,28 @@ def _render_html(players):
                     "Home",
                     "End"
                 ]);
-                if (allowedKeys.has(event.key)) {{
+                if (allowedKeys.has(event.key)) {
                     return;
-                }}
-                if (!/^[0-9]$/.test(event.key)) {{
+                }
+                if (!/^[0-9]$/.test(event.key)) {
                     event.preventDefault();
-                }}
-            }});
-            pointsInput.addEventListener("input", () => {{
+                }
+            });
+            pointsInput.addEventListener("input", () => {
                 pointsInput.value = pointsInput.value.replace(/[^0-9]/g, "");
-            }});
+            });
 
             const removeButton = document.createElement("button");
             removeButton.type = "button";
             removeButton.textContent = "x";
             removeButton.className = "secondary remove-row-button";
             removeButton.setAttribute("aria-label", "Remove result row");
-            removeButton.addEventListener("click", () => {{
+            removeButton.addEventListener("click", () => {
                 row.remove();
-                if (resultsRows.children.length === 0) {{
+                if (resultsRows.children.length === 0) {
                     resultsRows.appendChild(createResultRow(placeOptions[0]));
-                }}
-            }});
+                }
+            });
 
             placeCell.appendChild(placeSelect);
             playerCell.appendChild(playerInput);
@@ -738,47 +916,47 @@ def _render_html(players):
             row.appendChild(actionCell);
 
             return row;
-        }}
+        }
 
-        function resetRows() {{
+        function resetRows() {
             resultsRows.innerHTML = "";
             resultsRows.appendChild(createResultRow(placeOptions[0]));
-        }}
+        }
 
-        addRowButton.addEventListener("click", () => {{
+        addRowButton.addEventListener("click", () => {
             const currentRows = Array.from(resultsRows.querySelectorAll("tr"));
             const lastRow = currentRows[currentRows.length - 1];
             const previousPlace = lastRow ? lastRow.querySelector(".place-select").value : placeOptions[0];
             const defaultPlace = getNextPlace(previousPlace);
             resultsRows.appendChild(createResultRow(defaultPlace));
-        }});
+        });
 
-        addResultsLink.addEventListener("click", (event) => {{
+        addResultsLink.addEventListener("click", (event) => {
             event.preventDefault();
             const passwordInputValue = window.prompt("Enter password:");
-            if (passwordInputValue === PASSWORD) {{
+            if (passwordInputValue === PASSWORD) {
                 setDialogSeriesMode(false);
-                if (dialogSeriesSelect && seriesFilter) {{
+                if (dialogSeriesSelect && seriesFilter) {
                     dialogSeriesSelect.value = seriesFilter.value;
-                }}
+                }
                 resetRows();
                 addResultsDialog.showModal();
-            }} else if (passwordInputValue !== null) {{
+            } else if (passwordInputValue !== null) {
                 window.alert("Invalid password.");
-            }}
-        }});
+            }
+        });
 
-        cancelResultsButton.addEventListener("click", () => {{
+        cancelResultsButton.addEventListener("click", () => {
             addResultsDialog.close();
-        }});
+        });
 
-        saveResultsButton.addEventListener("click", async () => {{
+        saveResultsButton.addEventListener("click", async () => {
             const rows = Array.from(resultsRows.querySelectorAll("tr"));
             const results = [];
             const seenPlayers = new Set();
             let savedSeriesValue = "";
 
-            for (const row of rows) {{
+            for (const row of rows) {
                 const place = row.querySelector(".place-select").value;
                 const playerInput = row.querySelector("input[list='player-name-options']");
                 const pointsInput = row.querySelector(".points-input");
@@ -789,202 +967,251 @@ def _render_html(players):
                 const pointsValue = pointsInput.value;
                 const points = Number(pointsValue);
 
-                if (!player) {{
+                if (!player) {
                     window.alert("Each row must include a player.");
                     playerInput.focus();
                     return;
-                }}
+                }
 
-                if (!pointsValue || Number.isNaN(points) || points <= 0 || !Number.isInteger(points)) {{
+                if (!pointsValue || Number.isNaN(points) || points <= 0 || !Number.isInteger(points)) {
                     window.alert("Each row must include whole-number points greater than 0.");
                     pointsInput.focus();
                     return;
-                }}
-                if (!seriesValue) {{
+                }
+                if (!seriesValue) {
                     window.alert("Please enter a series name.");
-                    if (isNewSeriesMode && newSeriesInput) {{
+                    if (isNewSeriesMode && newSeriesInput) {
                         newSeriesInput.focus();
-                    }} else if (dialogSeriesSelect) {{
+                    } else if (dialogSeriesSelect) {
                         dialogSeriesSelect.focus();
-                    }}
+                    }
                     return;
-                }}
-                if (isNewSeriesMode) {{
+                }
+                if (isNewSeriesMode) {
                     const normalizedNewSeries = seriesValue.toLowerCase();
                     const existingSeriesMatch = seriesNames.some((value) => value.toLowerCase() === normalizedNewSeries);
-                    if (existingSeriesMatch) {{
+                    if (existingSeriesMatch) {
                         window.alert("Series already exists. Choose it from the list instead.");
-                        if (newSeriesInput) {{
+                        if (newSeriesInput) {
                             newSeriesInput.focus();
-                        }}
+                        }
                         return;
-                    }}
-                }}
+                    }
+                }
                 savedSeriesValue = seriesValue;
 
                 const normalizedPlayer = player.toLowerCase();
-                if (seenPlayers.has(normalizedPlayer)) {{
+                if (seenPlayers.has(normalizedPlayer)) {
                     window.alert("A player can only appear once in a single save.");
                     playerInput.focus();
                     return;
-                }}
+                }
                 seenPlayers.add(normalizedPlayer);
 
-                results.push({{
+                results.push({
                     place: place,
                     name: player,
                     series: seriesValue,
                     points: points
-                }});
-            }}
+                });
+            }
 
-            const saveEndpoint = `${{window.location.origin}}${{window.location.pathname.replace(/\\/?$/, "/results")}}`;
+            const saveEndpoint = `${window.location.origin}${window.location.pathname.replace(/\\/?$/, "/results")}`;
             saveResultsButton.setAttribute("aria-busy", "true");
             saveResultsButton.disabled = true;
-            try {{
-                const response = await fetch(saveEndpoint, {{
+            try {
+                const response = await fetch(saveEndpoint, {
                     method: "POST",
-                    headers: {{
+                    headers: {
                         "Content-Type": "application/json"
-                    }},
+                    },
                     body: JSON.stringify(results)
-                }});
+                });
 
-                if (!response.ok) {{
+                if (!response.ok) {
                     let errorMessage = "Failed to save results.";
-                    try {{
+                    try {
                         const errorPayload = await response.json();
-                        if (errorPayload && errorPayload.error) {{
+                        if (errorPayload && errorPayload.error) {
                             errorMessage = errorPayload.error;
-                        }}
-                    }} catch (_error) {{
+                        }
+                    } catch (_error) {
                         // Keep default message when body is not JSON.
-                    }}
+                    }
                     window.alert(errorMessage);
                     return;
-                }}
+                }
 
                 console.log("Results saved:");
                 console.log(results);
                 addResultsDialog.close();
                 const nextUrl = new URL(window.location.href);
-                if (savedSeriesValue) {{
+                if (savedSeriesValue) {
                     nextUrl.searchParams.set("series", savedSeriesValue);
-                }}
+                }
                 window.location.assign(nextUrl.toString());
-            }} catch (_error) {{
+            } catch (_error) {
                 window.alert("Failed to save results.");
-            }} finally {{
+            } finally {
                 saveResultsButton.removeAttribute("aria-busy");
                 saveResultsButton.disabled = false;
-            }}
-        }});
+            }
+        });
     </script>
     </body>
     <style>
-        body {{
+        body {
             padding: 2rem;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 800px;
             margin: 0 auto;
-        }}
-        .bottom-actions {{
+        }
+        .bottom-actions {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-top: 1rem;
-        }}
-        .series-updated-row {{
+        }
+        .series-updated-row {
             overflow: auto;
-        }}
-        .series-filter-wrap {{
+        }
+        .series-filter-wrap {
             float: left;
-        }}
-        .series-filter-wrap select {{
+        }
+        .series-filter-wrap select {
             margin-bottom: 0;
             width: auto;
             min-width: 14rem;
-        }}
-        .updated-text {{
+        }
+        .updated-text {
             float: right;
             margin-bottom: 0;
-        }}
-        @media (max-width: 768px) {{
-            .series-updated-row {{
+        }
+        @media (max-width: 768px) {
+            .series-updated-row {
                 overflow: visible;
-            }}
-            .series-filter-wrap {{
+            }
+            .series-filter-wrap {
                 float: none;
-            }}
-            .updated-text {{
+            }
+            .updated-text {
                 float: none;
                 margin-top: 0.5rem;
                 text-align: left;
-            }}
-        }}
+            }
+        }
         .results-table th,
-        .results-table td {{
+        .results-table td {
             vertical-align: middle;
-        }}
+        }
         .results-table input,
-        .results-table select {{
+        .results-table select {
             margin-bottom: 0;
-        }}
-        .remove-row-button {{
+        }
+        .remove-row-button {
             margin-bottom: 0;
             padding-left: 0.6rem;
             padding-right: 0.6rem;
-        }}
-        .dialog-actions {{
+        }
+        .dialog-actions {
             display: flex;
             justify-content: space-between;
             align-items: center;
             gap: 0.75rem;
-        }}
-        .dialog-header-row {{
+        }
+        .dialog-header-row {
             display: flex;
             align-items: center;
             justify-content: space-between;
             gap: 0.75rem;
-        }}
-        .dialog-header-row h3 {{
+        }
+        .dialog-header-row h3 {
             margin-bottom: 0;
             white-space: nowrap;
-        }}
-        .dialog-header-row select {{
+        }
+        .dialog-header-row select {
             margin-bottom: 0;
             width: auto;
             min-width: 12rem;
-        }}
-        .dialog-series-controls {{
+        }
+        .dialog-series-controls {
             display: flex;
             align-items: center;
             gap: 0.5rem;
-        }}
-        .dialog-series-controls input {{
+        }
+        .dialog-series-controls input {
             margin-bottom: 0;
             width: 12rem;
-        }}
-        .dialog-series-controls button {{
+        }
+        .dialog-series-controls button {
             margin-bottom: 0;
             white-space: nowrap;
-        }}
-        .dialog-actions-right {{
+        }
+        .dialog-actions-right {
             display: flex;
             gap: 0.75rem;
-        }}
-        .export-dialog-body fieldset {{
+        }
+        .export-dialog-body fieldset {
             margin-bottom: 1rem;
-        }}
-        .export-series-option {{
+        }
+        .export-series-option {
             display: block;
             margin-bottom: 0.35rem;
-        }}
+        }
     </style>
 </html>"""
 
 
+def _render_html(players):
+    series_values = _series_values_by_latest_updated(players)
+    rows_html, player_name_options_html, updated_text = _render_leaderboard(players, series_values)
+    series_values_json = json.dumps(series_values).replace("</", "<\\/")
+    updated_text_by_series_json = json.dumps(_series_latest_updated_text(players)).replace("</", "<\\/")
+    export_rows_json = json.dumps(_export_rows(players)).replace("</", "<\\/")
+    series_options_html = "\n".join(
+        [f"                    <option value=\"{_escape_html(series)}\">{_escape_html(series)}</option>" for series in series_values]
+    )
+    dialog_series_options_html = "\n".join(
+        [f"                        <option value=\"{_escape_html(series)}\">{_escape_html(series)}</option>" for series in series_values]
+    )
+    export_series_checkboxes_html = "\n".join(
+        [
+            (
+                "                    <label class=\"export-series-option\">"
+                f"<input type=\"checkbox\" name=\"export-series\" value=\"{_escape_html(series)}\" checked> {_escape_html(series)}"
+                "</label>"
+            )
+            for series in series_values
+        ]
+    )
+
+    buf = io.StringIO()
+    for fragment in (
+        _HTML_BEFORE_SERIES_OPTIONS,
+        series_options_html,
+        _HTML_BEFORE_UPDATED_TEXT,
+        _escape_html(updated_text),
+        _HTML_BEFORE_ROWS,
+        rows_html,
+        _HTML_BEFORE_DIALOG_SERIES_OPTIONS,
+        dialog_series_options_html,
+        _HTML_BEFORE_EXPORT_SERIES_CHECKBOXES,
+        export_series_checkboxes_html,
+        _HTML_BEFORE_PLAYER_NAME_OPTIONS,
+        player_name_options_html,
+        _HTML_BEFORE_SERIES_VALUES_JSON,
+        series_values_json,
+        _HTML_BEFORE_UPDATED_BY_SERIES_JSON,
+        updated_text_by_series_json,
+        _HTML_BEFORE_EXPORT_ROWS_JSON,
+        export_rows_json,
+        _HTML_SUFFIX,
+    ):
+        buf.write(fragment)
+    return buf.getvalue()
+
+
 def handler(event, context):
     method = _http_method(event)
     path = _request_path(event).rstrip("/") or "/"
@@ -995,6 +1222,7 @@ def handler(event, context):
         try:
             submitted_results = _parse_json_body(event)
             save_summary = _upsert_results(TABLE_NAME, submitted_results)
+            _html_cache["expires"] = 0.0
             logger.info("POST /results succeeded: %s", save_summary)
             return _json_response(200, {"ok": True, **save_summary})
         except ValueError as error:
@@ -1010,9 +1238,18 @@ def handler(event, context):
             logger.exception("POST /results unexpected error.")
             return _json_response(500, {"ok": False, "error": "Failed to save results."})
 
+    wants_gzip = _accepts_gzip(event)
+    if _html_cache["body"] is not None and time.monotonic() < _html_cache["expires"]:
+        logger.info("Serving leaderboard HTML from in-process cache.")
+        if wants_gzip:
+            if _html_cache["gzip_b64"] is None:
+                _html_cache["gzip_b64"] = _gzip_html_body(_html_cache["body"])
+            return _gzip_html_response(200, _html_cache["gzip_b64"])
+        return _html_response(200, _html_cache["body"])
+
     try:
         players = _load_players(TABLE_NAME)
-        logger.info("Loaded %d players for HTML response.", len(players))
+        logger.info("Loaded %d players for HTML response.", len(players["names"]))
     except (BotoCoreError, ClientError):
         logger.exception("Failed to load players for HTML response.")
         return _html_response(500, "<html><body><h1>Failed to load tournament data.</h1></body></html>")
@@ -1020,4 +1257,11 @@ def handler(event, context):
         logger.exception("Unexpected error while building HTML response.")
         return _html_response(500, "<html><body><h1>Failed to load tournament data.</h1></body></html>")
 
-    return _html_response(200, _render_html(players))
+    body = _render_html(players)
+    _html_cache["body"] = body
+    _html_cache["gzip_b64"] = None
+    _html_cache["expires"] = time.monotonic() + HTML_CACHE_TTL_SECONDS
+    if wants_gzip:
+        _html_cache["gzip_b64"] = _gzip_html_body(body)
+        return _gzip_html_response(200, _html_cache["gzip_b64"])
+    return _html_response(200, body)